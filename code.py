@@ -1,18 +1,98 @@
 # SPDX-License-Identifier: MIT
 # SPDX-FileCopyrightText: Copyright 2025 Sam Blenny
+from array import array
 from board import CKP, CKN, D0P, D0N, D1P, D1N, D2P, D2N
 import bitmaptools
 import displayio
 from displayio import Bitmap, Group, Palette, TileGrid
 import framebufferio
 import gc
-import math
+from math import cos, radians, sin
+from micropython import const
+import os
+from palette_swirl import palette_data
 import picodvi
-import random
 import supervisor
 import sys
 from time import sleep
-from ulab import numpy as np
+
+
+# Constants for the frame loop. Using const() lets the compiler inline these
+# values rather than looking them up as globals or instance attributes. The
+# LineTrail bitmap must be _WIDTH x _HEIGHT pixels.
+_WIDTH = const(320)
+_HEIGHT = const(240)
+_XMAX = const(_WIDTH - 1)
+_YMAX = const(_HEIGHT - 1)
+_SPEED = const(8)         # endpoint step size in pixels per frame
+_DRIFT = const(2)         # maximum random heading change in degrees
+_DRIFT_SPAN = const(2 * _DRIFT + 1)
+_DRIFT_SIZE = const(4096) # drift table size (must be a power of 2)
+_MAX_LINES = const(21)
+_HALF_TURN = const(180)
+_FULL_TURN = const(360)
+_FRAME_MS = const(60)
+
+# Heading angle lookup tables for bouncing off vertical (x) and horizontal (y)
+# edges, indexed by integer heading angle in degrees
+REFLECT_X = array('H',
+    [(_HALF_TURN - a) % _FULL_TURN for a in range(_FULL_TURN)])
+REFLECT_Y = array('H',
+    [(_FULL_TURN - a) % _FULL_TURN for a in range(_FULL_TURN)])
+
+def _step_tables(spd):
+    """Make x and y step lookup tables for moving spd pixels at each heading.
+    Returns:
+    (dx, dy): tuple of array('f') indexed by integer heading angle in degrees
+    """
+    dx = array('f', [spd * cos(radians(i)) for i in range(_FULL_TURN)])
+    dy = array('f', [spd * sin(radians(i)) for i in range(_FULL_TURN)])
+    return (dx, dy)
+
+def _advance(pos, heading, dx, dy, drift, i):
+    """Move both endpoints one step and bounce them off the bitmap edges.
+    pos: array('f') of [x1, y1, x2, y2], updated in place
+    heading: array('H') of [angle1, angle2] in degrees 0-359, updated in place
+    dx, dy: step lookup tables from _step_tables()
+    drift: random bytes, read at i and i+1 and mapped to -_DRIFT..+_DRIFT
+    Returns:
+    (x1, y1, x2, y2): tuple of rounded endpoint coordinates
+    """
+    # Bind globals to locals since local lookups are faster in the VM
+    reflect_x = REFLECT_X
+    reflect_y = REFLECT_Y
+    # Apply some random drift to the heading angles so that they don't get
+    # stuck in a boring repetitive pattern
+    a1 = (heading[0] + (drift[i] % _DRIFT_SPAN) - _DRIFT) % _FULL_TURN
+    a2 = (heading[1] + (drift[i+1] % _DRIFT_SPAN) - _DRIFT) % _FULL_TURN
+    # Compute new start point
+    x1 = pos[0] + dx[a1]
+    y1 = pos[1] + dy[a1]
+    # Bounce if new point crossed an edge: reflect the coordinate back inside
+    # the bitmap, then mirror the heading across the edge's normal
+    if x1 < 0 or x1 > _XMAX:
+        x1 = (0 - x1) if (x1 < 0) else (2 * _XMAX - x1)
+        a1 = reflect_x[a1]
+    if y1 < 0 or y1 > _YMAX:
+        y1 = (0 - y1) if (y1 < 0) else (2 * _YMAX - y1)
+        a1 = reflect_y[a1]
+    # Compute new end point (with the same bounce logic)
+    x2 = pos[2] + dx[a2]
+    y2 = pos[3] + dy[a2]
+    if x2 < 0 or x2 > _XMAX:
+        x2 = (0 - x2) if (x2 < 0) else (2 * _XMAX - x2)
+        a2 = reflect_x[a2]
+    if y2 < 0 or y2 > _YMAX:
+        y2 = (0 - y2) if (y2 < 0) else (2 * _YMAX - y2)
+        a2 = reflect_y[a2]
+    pos[0] = x1
+    pos[1] = y1
+    pos[2] = x2
+    pos[3] = y2
+    heading[0] = a1
+    heading[1] = a2
+    # Round with int() since coordinates are never negative after bouncing
+    return (int(x1 + 0.5), int(y1 + 0.5), int(x2 + 0.5), int(y2 + 0.5))
 
 
 class LineTrail:
@@ -22,145 +102,109 @@ class LineTrail:
     coordinate, y coordinate, and heading angle. The points drift at a fixed
     speed in the direction of their heading angles. The angles change when they
     bounce off an edge of the bitmap.
+    The trail draws itself into the bitmap without clearing it: each update
+    erases the oldest line, redraws the surviving lines to repair pixels where
+    they crossed it, and then draws the newest line.
     """
     def __init__(self, x1, y1, angle1, x2, y2, angle2, bitmap, palette):
         first_color = 1
-        first_line = (x1, y1, x2, y2, first_color)
-        self.lines = [first_line]
-        self.x1 = x1
-        self.y1 = y1
-        self.x2 = x2
-        self.y2 = y2
-        self.angle1 = angle1
-        self.angle2 = angle2
+        # The trail is a ring buffer of fixed slots stored as parallel arrays
+        # of endpoint coordinates and colors. self.head is the slot holding
+        # the oldest line, which gets replaced by the next new line. Empty
+        # slots hold a zero length line at (0, 0).
+        n = _MAX_LINES
+        self.xs1 = array('h', [0] * n)
+        self.ys1 = array('h', [0] * n)
+        self.xs2 = array('h', [0] * n)
+        self.ys2 = array('h', [0] * n)
+        self.cs = array('B', [0] * n)
+        (self.xs1[0], self.ys1[0]) = (x1, y1)
+        (self.xs2[0], self.ys2[0]) = (x2, y2)
+        self.cs[0] = first_color
+        self.head = 1
+        self.bitmap = bitmap
+        # Endpoint state is kept in arrays so _advance can update it in place
+        # without creating new objects for each attribute
+        self.pos = array('f', [x1, y1, x2, y2])
+        self.heading = array('H', [angle1 % _FULL_TURN, angle2 % _FULL_TURN])
         self.color = first_color
-        self.width = bitmap.width
-        self.height = bitmap.height
         self.max_color = len(palette) - 1
-        self.speed = 8
-        self.max_lines = 21
+        # Heading angles stay as integer degrees so they can index step tables
+        # with the speed already multiplied in. That way, each frame needs no
+        # trig functions, radian conversions, or speed multiplies.
+        (self.dx, self.dy) = _step_tables(_SPEED)
+        # Random heading drift comes from one batch of random bytes read at
+        # startup. The bytes get mapped to drift angles as they're used, so
+        # boot doesn't need a Python loop over the whole table.
+        self.drift = os.urandom(_DRIFT_SIZE)
+        self.drift_i = 0
         self.bg_color = 0
+        bitmaptools.draw_line(bitmap, x1, y1, x2, y2, first_color)
 
     def update_trail(self):
-        """Compute endpoints of the next line and remove the last line"""
-        spd = self.speed
-        w = self.width
-        h = self.height
-        # Apply some random drift to the heading angles so that they don't get
-        # stuck in a boring repetitive pattern
-        drift = 2
-        a1 = self.angle1 + random.uniform(-drift, drift) % 360
-        a2 = self.angle2 + random.uniform(-drift, drift) % 360
-        # Compute new start point
-        a1r = math.radians(a1)
-        x1 = self.x1 + (spd * math.cos(a1r))
-        y1 = self.y1 + (spd * math.sin(a1r))
-        # Adjust for bounce if new point crossed an edge
-        if x1 < 0:
-            x1 = 0 - x1
-            a1 = (180 - a1) if (a1 <= 180) else (360 - (a1 - 180))
-        if x1 >= width:
-            x1 = width - (x1 - width)
-            a1 = (180 - a1) if (a1 >= 0) else (180 + (360 - a1))
-        if y1 < 0:
-            y1 = 0 - y1
-            a1 = (360 - a1) if (a1 <= 90) else (360 - a1)
-        if y1 >= height:
-            y1 = height - (y1 - height)
-            a1 = 360 - a1
-        self.x1 = x1
-        self.y1 = y1
-        self.angle1 = a1
-        # Compute new end point
-        a2r = math.radians(a2)
-        x2 = self.x2 + (spd * math.cos(a2r))
-        y2 = self.y2 + (spd * math.sin(a2r))
-        # Adjust for bounce if new point crossed an edge
-        if x2 < 0:
-            x2 = 0 - x2
-            a2 = (180 - a1) if (a1 <= 180) else (360 - (a1 - 180))
-        if x2 >= width:
-            x2 = width - (x2 - width)
-            a2 = (180 - a2) if (a2 >= 0) else (180 + (360 - a2))
-        if y2 < 0:
-            y2 = 0 - y2
-            a2 = (360 - a2) if (a2 <= 90) else (360 - a2)
-        if y2 >= height:
-            y2 = height - (y2 - height)
-            a2 = 360 - a2
-        self.x2 = x2
-        self.y2 = y2
-        self.angle2 = a2
+        """Replace the oldest line with a new line and update the bitmap"""
+        bitmap = self.bitmap
+        xs1 = self.xs1
+        ys1 = self.ys1
+        xs2 = self.xs2
+        ys2 = self.ys2
+        head = self.head
+        i = self.drift_i
+        (x1, y1, x2, y2) = _advance(self.pos, self.heading, self.dx, self.dy,
+            self.drift, i)
+        self.drift_i = (i + 2) & (_DRIFT_SIZE - 1)
         # Compute new color
         c = self.color
         c = (1) if (c == self.max_color) else (c + 1)
         self.color = c
-        # Add new line to the list, deleting the oldest line if needed
-        self.lines.append((round(x1), round(y1), round(x2), round(y2), c))
-        if len(self.lines) > self.max_lines:
-            self.lines.pop(0)
+        # Erase the oldest line from the bitmap (draw it in background color).
+        # That also blanks pixels where it crossed newer lines, so redraw the
+        # surviving lines from oldest to newest. Then replace the oldest line
+        # with the new line and draw that. All survivors get redrawn because
+        # consecutive lines are only a few pixels apart. Their bounding boxes
+        # nearly all overlap, so skipping lines by bounding box would save
+        # only about 3 of the 22 draw_line calls, at the cost of more work in
+        # Python for every line.
+        draw_line = bitmaptools.draw_line
+        cs = self.cs
+        draw_line(bitmap, xs1[head], ys1[head], xs2[head], ys2[head],
+            self.bg_color)
+        for j in range(1, _MAX_LINES):
+            k = (head + j) % _MAX_LINES
+            draw_line(bitmap, xs1[k], ys1[k], xs2[k], ys2[k], cs[k])
+        xs1[head] = x1
+        ys1[head] = y1
+        xs2[head] = x2
+        ys2[head] = y2
+        cs[head] = c
+        draw_line(bitmap, x1, y1, x2, y2, c)
+        self.head = (head + 1) % _MAX_LINES
 
 
-    def draw_into(self, bitmap):
-        """Draw all the lines into the provided bitmap"""
-        bitmap.fill(self.bg_color)
-        for (x1, y1, x2, y2, color) in self.lines:
-            bitmaptools.draw_line(bitmap, x1, y1, x2, y2, color)
+# supervisor.ticks_ms() wraps around after 2**29 milliseconds
+_TICKS_PERIOD = const(1 << 29)
+_TICKS_MASK = const(_TICKS_PERIOD - 1)
+_TICKS_HALF = const(_TICKS_PERIOD // 2)
 
+def ticks_add(ticks, delta):
+    """Add delta milliseconds to ticks, allowing for wraparound"""
+    return (ticks + delta) & _TICKS_MASK
 
-def LCh_to_sRGB(L, C, h):
-    """Convert L*C*h color to sRGB color using D65 whitepoint.
-    L*: perceptual Lightness in range 0-1.0
-    C*: Chroma in range 0-1.0
-    h: hue angle in range 0-360 degrees
-    Returns:
-    (R, G, B): tuple of red, green, and blue values in range 0-255
+def ticks_diff(a, b):
+    """Return signed difference a - b of two ticks values, allowing for
+    wraparound"""
+    return ((a - b + _TICKS_HALF) & _TICKS_MASK) - _TICKS_HALF
+
+def load_palette(data):
+    """Make a Palette from packed (r, g, b) byte triplets.
+    The palette size comes from the data, so it always matches whatever size
+    make_palette.py generated.
     """
-    # 1. Convert L*C*h to Lab (L stays the same)
-    rh = math.radians(h)
-    a = C * math.cos(rh)
-    b = C * math.sin(rh)
-    # 2. Convert L*a*b* (non-linear perceptual) to XYZ (linear)
-    #    D65 reference white value: {X: 0.95047, Y: 1.0, Z: 1.08883}.
-    epsilon = 0.008856
-    k = 903.3
-    fy = (L + 16) / 116
-    fx = (a / 500) + fy
-    fz = fy - (b / 200)
-    xr = fx ** 3
-    if xr <= epsilon:
-        xr = ((116 * fx) - 16) / k
-    yr = ((L + 16) / 116) ** 3
-    if L <= k * epsilon:
-        yr = L / k
-    zr = fz ** 3
-    if zr <= epsilon:
-        zr = ((116 * fz) - 16) / k
-    XYZ = np.array([[xr * 0.95047], [yr * 1.00], [zr * 1.08883]])  # D65
-    # 3. Convert XYZ to linear sRGB.
-    #    M is the chromatic adaptation matrix for XYZ to sRGB with D65 white
-    M = np.array([
-        [ 3.2404542, -1.5371385, -0.4985314],
-        [-0.9692660,  1.8760108,  0.0415560],
-        [ 0.0556434, -0.2040259,  1.0572252]])
-    RGB_linear = np.dot(M, XYZ)
-    # 4. Apply sRGB gamma curve compensation
-    compand = np.vectorize(lambda v:
-        (12.92 * v) if (v <= 0.0031308) else (pow(1.055 * v, 1/2.4) - 0.055))
-    RGB = compand(RGB_linear)
-    # 5. Scale output range from 0-1.0 up to 0-255
-    scale = np.vectorize(lambda v: min(255, max(0, v * 25500)))
-    sRGB = tuple([int(n) for n in np.flip(scale(RGB))])
-    return sRGB
-
-def fill_gradient_palette(palette, L, C):
-    """Make gradient palette with variable hue at fixed Lightness & Chroma"""
-    palette[0] = (0, 0, 0)
-    n = len(palette)
-    for i in range(1, n):
-        h = 360 * (i / (n-1))
-        sRGB = LCh_to_sRGB(L, C, h)
-        palette[i] = sRGB
+    n = len(data) // 3
+    palette = Palette(n)
+    for i in range(n):
+        palette[i] = (data[3*i], data[3*i+1], data[3*i+2])
+    return palette
 
 def init_display(width, height, color_depth):
     """Initialize the picodvi display
@@ -183,29 +227,38 @@ def init_display(width, height, color_depth):
 
 
 # Configure display with requested picodvi video mode
-(width, height, color_depth) = (320, 240, 16)
+(width, height, color_depth) = (_WIDTH, _HEIGHT, 16)
 display = init_display(width, height, color_depth)
 display.auto_refresh = False
 
 # Make a drawing canvas: bitmap + palette + tilegrid + group
-palette = Palette(256)
-bitmap = Bitmap(width, height, 256)
+# The color swirl palette is precomputed (see make_palette.py)
+palette = load_palette(palette_data)
+bitmap = Bitmap(width, height, len(palette))
 tilegrid = TileGrid(bitmap, pixel_shader=palette)
 grp = Group(scale=1)
 grp.append(tilegrid)
 display.root_group = grp
 
-# Make a color swirl palette
-(L, C) = (0.24, 0.76)
-fill_gradient_palette(palette, L, C)
-
 # Initialize the trail of lines
 lines = LineTrail(x1=31, y1=17, angle1=23, x2=163, y2=109, angle2=71,
     bitmap=bitmap, palette=palette)
 
 # Main Loop
+# CircuitPython has no _thread module, so the trail math can't run on the
+# RP2350's second core while display.refresh() runs on the first. Each frame
+# runs these steps in sequence on one core.
+# Frames are paced against a deadline, so the sleep only covers whatever part
+# of the frame time is left after drawing and refreshing.
+deadline = ticks_add(supervisor.ticks_ms(), _FRAME_MS)
 while True:
     lines.update_trail()
-    lines.draw_into(bitmap)
     display.refresh()
-    sleep(0.06)
+    delay = ticks_diff(deadline, supervisor.ticks_ms())
+    if delay > 0:
+        sleep(delay / 1000)
+    elif delay < -_FRAME_MS:
+        # Running more than a frame late, so resync rather than rushing
+        # through a burst of frames to catch up
+        deadline = supervisor.ticks_ms()
+    deadline = ticks_add(deadline, _FRAME_MS)
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: Copyright 2025 Sam Blenny
+"""
+Generate palette_swirl.py, the precomputed color swirl palette for code.py.
+
+Computing the LCh gradient takes a noticeable amount of time on a
+microcontroller, and the result never changes, so this runs ahead of time on
+a desktop computer with numpy. You can run it manually as `make palette`.
+"""
+import numpy as np
+
+
+OUTFILE = 'palette_swirl.py'
+SIZE = 256
+(L, C) = (0.24, 0.76)
+
+def LCh_to_sRGB(L, C, h):
+    """Convert L*C*h colors to sRGB colors using D65 whitepoint.
+    L*: perceptual Lightness in range 0-1.0
+    C*: Chroma in range 0-1.0
+    h: ndarray of hue angles in range 0-360 degrees
+    Returns:
+    ndarray of shape (3, len(h)) holding blue, green, and red rows with values
+    in range 0-255 (this channel order matches the old per-color tuples)
+    """
+    # 1. Convert L*C*h to Lab (L stays the same)
+    rh = np.radians(h)
+    a = C * np.cos(rh)
+    b = C * np.sin(rh)
+    # 2. Convert L*a*b* (non-linear perceptual) to XYZ (linear)
+    #    D65 reference white value: {X: 0.95047, Y: 1.0, Z: 1.08883}.
+    epsilon = 0.008856
+    k = 903.3
+    fy = (L + 16) / 116
+    fx = (a / 500) + fy
+    fz = fy - (b / 200)
+    xr = fx ** 3
+    xr = np.where(xr <= epsilon, ((116 * fx) - 16) / k, xr)
+    yr = ((L + 16) / 116) ** 3
+    if L <= k * epsilon:
+        yr = L / k
+    zr = fz ** 3
+    zr = np.where(zr <= epsilon, ((116 * fz) - 16) / k, zr)
+    XYZ = np.array([xr * 0.95047, np.full(len(h), yr * 1.00),
+        zr * 1.08883])  # D65
+    # 3. Convert XYZ to linear sRGB.
+    #    M is the chromatic adaptation matrix for XYZ to sRGB with D65 white
+    M = np.array([
+        [ 3.2404542, -1.5371385, -0.4985314],
+        [-0.9692660,  1.8760108,  0.0415560],
+        [ 0.0556434, -0.2040259,  1.0572252]])
+    RGB_linear = np.dot(M, XYZ)
+    # 4. Apply sRGB gamma curve compensation. The maximum() keeps pow() away
+    #    from negative values in the branch that np.where() discards.
+    t = 0.0031308
+    RGB = np.where(RGB_linear <= t, 12.92 * RGB_linear,
+        ((1.055 * np.maximum(RGB_linear, t)) ** (1/2.4)) - 0.055)
+    # 5. Scale output range from 0-1.0 up to 0-255
+    return np.flip(np.clip(RGB * 25500, 0, 255), axis=0)
+
+def fill_gradient_palette(palette, L, C):
+    """Make gradient palette with variable hue at fixed Lightness & Chroma"""
+    palette[0] = (0, 0, 0)
+    n = len(palette)
+    sRGB = LCh_to_sRGB(L, C, np.linspace(0, 360, n))
+    for i in range(1, n):
+        palette[i] = (int(sRGB[0, i]), int(sRGB[1, i]), int(sRGB[2, i]))
+
+def main():
+    palette = [None] * SIZE
+    fill_gradient_palette(palette, L, C)
+    data = bytes([v for rgb in palette for v in rgb])
+    with open(OUTFILE, 'w') as f:
+        print("# SPDX-License-Identifier: MIT", file=f)
+        print("# SPDX-FileCopyrightText: Copyright 2025 Sam Blenny", file=f)
+        print(f"# Generated by make_palette.py: {SIZE} colors, "
+            f"L={L}, C={C}", file=f)
+        print("# Packed (r, g, b) byte triplets for each palette entry", file=f)
+        print("palette_data = (", file=f)
+        for i in range(0, len(data), 16):
+            line = ''.join(f'\\x{v:02x}' for v in data[i:i+16])
+            print(f"    b'{line}'", file=f)
+        print(")", file=f)
+
+main()
@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: MIT
+# SPDX-FileCopyrightText: Copyright 2025 Sam Blenny
+# Generated by make_palette.py: 256 colors, L=0.24, C=0.76
+# Packed (r, g, b) byte triplets for each palette entry
+palette_data = (
+    b'\x00\x00\x00\x56\x1c\xff\x51\x1c\xff\x4d\x1b\xff\x48\x1b\xff\x44'
+    b'\x1b\xff\x3f\x1b\xff\x3b\x1b\xff\x36\x1c\xff\x32\x1c\xff\x2d\x1c'
+    b'\xff\x29\x1c\xff\x24\x1c\xff\x20\x1d\xff\x1c\x1d\xff\x17\x1d\xff'
+    b'\x13\x1e\xff\x0f\x1e\xff\x0b\x1e\xff\x07\x1f\xff\x02\x1f\xff\x00'
+    b'\x20\xff\x00\x21\xff\x00\x21\xff\x00\x22\xff\x00\x22\xff\x00\x23'
+    b'\xff\x00\x24\xff\x00\x25\xff\x00\x26\xff\x00\x26\xff\x00\x27\xff'
+    b'\x00\x28\xff\x00\x29\xff\x00\x2a\xff\x00\x2b\xff\x00\x2c\xff\x00'
+    b'\x2d\xff\x00\x2e\xff\x00\x2f\xff\x00\x30\xff\x00\x31\xff\x00\x33'
+    b'\xff\x00\x34\xff\x00\x35\xff\x00\x36\xfd\x00\x37\xfa\x00\x39\xf6'
+    b'\x00\x3a\xf3\x00\x3b\xef\x00\x3c\xeb\x00\x3e\xe7\x00\x3f\xe3\x00'
+    b'\x41\xdf\x00\x42\xdb\x00\x43\xd7\x00\x45\xd2\x00\x46\xce\x00\x47'
+    b'\xc9\x00\x49\xc5\x00\x4a\xc0\x00\x4c\xbc\x00\x4d\xb7\x00\x4f\xb2'
+    b'\x00\x50\xad\x00\x52\xa8\x00\x53\xa3\x00\x55\x9e\x00\x56\x99\x00'
+    b'\x57\x94\x00\x59\x8f\x00\x5a\x8a\x00\x5c\x85\x00\x5d\x7f\x00\x5f'
+    b'\x7a\x00\x60\x75\x00\x62\x6f\x00\x63\x6a\x00\x65\x65\x00\x66\x60'
+    b'\x00\x67\x5a\x00\x69\x55\x00\x6a\x50\x00\x6c\x4a\x00\x6d\x45\x00'
+    b'\x6e\x40\x00\x70\x3a\x00\x71\x35\x00\x72\x30\x00\x74\x2b\x00\x75'
+    b'\x25\x00\x76\x20\x00\x77\x1b\x00\x79\x16\x00\x7a\x11\x00\x7b\x0c'
+    b'\x00\x7c\x07\x00\x7d\x02\x00\x7e\x00\x00\x80\x00\x00\x81\x00\x00'
+    b'\x82\x00\x00\x83\x00\x00\x84\x00\x00\x85\x00\x00\x86\x00\x00\x86'
+    b'\x00\x00\x87\x00\x00\x88\x00\x03\x89\x00\x07\x8a\x00\x0b\x8b\x00'
+    b'\x0f\x8b\x00\x13\x8c\x00\x17\x8d\x00\x1c\x8d\x00\x20\x8e\x00\x24'
+    b'\x8e\x00\x29\x8f\x00\x2d\x8f\x00\x32\x90\x00\x36\x90\x00\x3b\x91'
+    b'\x00\x3f\x91\x00\x44\x91\x00\x48\x92\x00\x4d\x92\x00\x51\x92\x00'
+    b'\x56\x92\x00\x5a\x93\x00\x5f\x93\x00\x64\x93\x00\x68\x93\x00\x6d'
+    b'\x93\x00\x71\x93\x00\x76\x93\x00\x7a\x92\x00\x7f\x92\x00\x83\x92'
+    b'\x00\x88\x92\x00\x8c\x92\x00\x90\x91\x00\x95\x91\x00\x99\x91\x00'
+    b'\x9d\x90\x00\xa1\x90\x00\xa5\x8f\x00\xaa\x8f\x00\xae\x8e\x00\xb2'
+    b'\x8e\x00\xb6\x8d\x00\xb9\x8d\x00\xbd\x8c\x00\xc1\x8b\x00\xc5\x8b'
+    b'\x00\xc8\x8a\x00\xcc\x89\x00\xcf\x88\x00\xd3\x87\x00\xd6\x86\x00'
+    b'\xda\x86\x00\xdd\x85\x00\xe0\x84\x00\xe3\x83\x00\xe6\x82\x00\xe9'
+    b'\x81\x00\xeb\x7f\x00\xee\x7e\x00\xf1\x7d\x00\xf3\x7c\x00\xf6\x7b'
+    b'\x00\xf8\x7a\x00\xfa\x79\x00\xfc\x77\x00\xfe\x76\x00\xff\x75\x00'
+    b'\xff\x74\x00\xff\x72\x00\xff\x71\x00\xff\x70\x00\xff\x6e\x00\xff'
+    b'\x6d\x00\xff\x6c\x00\xff\x6a\x00\xff\x69\x00\xff\x67\x00\xff\x66'
+    b'\x00\xff\x64\x00\xff\x63\x00\xff\x62\x00\xff\x60\x00\xff\x5f\x00'
+    b'\xff\x5d\x03\xff\x5c\x08\xff\x5a\x0d\xff\x59\x12\xff\x57\x17\xff'
+    b'\x56\x1d\xff\x54\x22\xff\x53\x27\xff\x51\x2c\xff\x50\x31\xff\x4f'
+    b'\x37\xff\x4d\x3c\xff\x4c\x41\xff\x4a\x47\xff\x49\x4c\xff\x47\x51'
+    b'\xff\x46\x57\xff\x45\x5c\xfe\x43\x61\xfc\x42\x67\xfa\x40\x6c\xf8'
+    b'\x3f\x71\xf6\x3e\x76\xf3\x3c\x7c\xf1\x3b\x81\xee\x3a\x86\xeb\x39'
+    b'\x8b\xe9\x37\x91\xe6\x36\x96\xe3\x35\x9b\xe0\x34\xa0\xdd\x32\xa5'
+    b'\xda\x31\xaa\xd6\x30\xaf\xd3\x2f\xb3\xcf\x2e\xb8\xcc\x2d\xbd\xc8'
+    b'\x2c\xc2\xc5\x2b\xc6\xc1\x2a\xcb\xbd\x29\xcf\xb9\x28\xd4\xb6\x27'
+    b'\xd8\xb2\x26\xdc\xae\x25\xe0\xaa\x25\xe4\xa5\x24\xe8\xa1\x23\xec'
+    b'\x9d\x22\xf0\x99\x22\xf4\x95\x21\xf8\x90\x20\xfb\x8c\x20\xff\x87'
+    b'\x1f\xff\x83\x1f\xff\x7f\x1e\xff\x7a\x1e\xff\x76\x1e\xff\x71\x1d'
+    b'\xff\x6d\x1d\xff\x68\x1c\xff\x64\x1c\xff\x5f\x1c\xff\x5a\x1c\xff'
+)